@@ -18,27 +18,34 @@ Options:
     --base-dir PATH        Base case directory (default: ./baseCase)
     --stl-dir PATH         Directory containing STL files (optional, will prompt if not provided)
     --n-proc N            Number of processors for parallel run (default: 6)
+    --hardlink-stls       Hardlink STL files into the case instead of copying
+    --serial-sfe          Run surfaceFeatureExtract invocations one at a time
     --auto-run            Skip confirmations and run automatically
     --cli-mode            Use command line interface for folder selection (no GUI)
 """
 
+import asyncio
+import io
 import shutil
+import hashlib
+import tarfile
+import mmap
 import os
+import struct
+import subprocess
 import sys
 import argparse
 import time
 import numpy as np
-import trimesh
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from tkinter import filedialog
-import tkinter as tk
 from typing import Dict, Optional
 
-# Import OpenFOAM runners from your existing code
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedParameterFile
-from PyFoam.Execution.UtilityRunner import UtilityRunner
-from PyFoam.Execution.BasicRunner import BasicRunner
+# tkinter, trimesh and PyFoam are imported lazily at their point of use:
+# headless sweeps with --stl-dir --auto-run never touch tkinter, and
+# trimesh's import chain (scipy, networkx, PIL) only loads if an STL
+# actually needs its general parser
 
 
 class STLFileSelector:
@@ -60,21 +67,23 @@ class STLFileSelector:
         for stl_file in stl_files:
             print(f"  {stl_file.name}")
         
+        # Lowercase every filename once; exact stem matches resolve with a
+        # single dict lookup, substring scanning is only the fallback
+        by_stem = {stl_file.stem.lower(): stl_file for stl_file in stl_files}
+        lowered = [(stl_file, stl_file.name.lower()) for stl_file in stl_files]
+
         # Try to match each component
         for component in self.stl_components:
-            matching_files = []
-            
-            # Look for files that contain the component name (case-insensitive)
-            for stl_file in stl_files:
-                filename = stl_file.name.lower()
-                component_lower = component.lower()
-                
-                # Check various naming patterns
-                if (component_lower in filename or 
-                    filename.startswith(component_lower) or 
-                    filename.endswith(f"{component_lower}.stl")):
-                    matching_files.append(stl_file)
-            
+            component_lower = component.lower()
+
+            exact_match = by_stem.get(component_lower)
+            if exact_match is not None:
+                matching_files = [exact_match]
+            else:
+                # Look for files that contain the component name (case-insensitive)
+                matching_files = [stl_file for stl_file, filename in lowered
+                                  if component_lower in filename]
+
             if len(matching_files) == 1:
                 found_files[component] = str(matching_files[0])
                 print(f"✓ {component}: {matching_files[0].name}")
@@ -103,6 +112,9 @@ class STLFileSelector:
     
     def select_files_gui(self) -> Dict[str, str]:
         """Select STL folder using GUI dialog"""
+        import tkinter as tk
+        from tkinter import filedialog
+
         root = tk.Tk()
         root.withdraw()  # Hide the main window
         
@@ -160,48 +172,229 @@ class STLFileSelector:
         return self.selected_files
 
 
+# Binary STL layout: 80-byte header, uint32 triangle count, then one
+# 50-byte record per triangle (normal, 3 vertices, attribute count)
+_STL_RECORD_DTYPE = np.dtype([('n', '<f4', (3,)), ('v', '<f4', (3, 3)), ('attr', '<u2')])
+
+_ASCII_VERTEX_RE = re.compile(rb'vertex\s+(\S+)\s+(\S+)\s+(\S+)')
+
+
+def _vertex_mean(vertices: np.ndarray) -> np.ndarray:
+    """Average unique vertex positions of an (N, 3) vertex array"""
+    # Triangles share vertices (~6 faces per vertex on a typical
+    # manifold), so dedupe first: the mean is not biased towards heavily
+    # tessellated regions and far fewer points are averaged - the right
+    # semantics for placing a wheel's rotation axis
+    return np.unique(vertices, axis=0).mean(axis=0)
+
+
+def _ascii_stl_centroid(data: bytes) -> np.ndarray:
+    """Compute the vertex centroid of an ASCII STL buffer"""
+    vertices = np.array(_ASCII_VERTEX_RE.findall(data), dtype=np.float64)
+    if len(vertices) == 0:
+        raise ValueError("no vertex lines found in ASCII STL")
+    return _vertex_mean(vertices)
+
+
+def _stl_vertex_centroid(file_path: str) -> np.ndarray:
+    """Compute the vertex centroid of an STL file without a full mesh load"""
+    file_size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        header = f.read(84)
+        if len(header) == 84:
+            n_tri = struct.unpack('<I', header[80:84])[0]
+            # ASCII files start with "solid " but so can binary headers;
+            # trust the triangle count against the actual file size
+            if not header.startswith(b'solid ') or file_size == 84 + 50 * n_tri:
+                records = np.frombuffer(f.read(50 * n_tri), dtype=_STL_RECORD_DTYPE)
+                if len(records) == n_tri:
+                    return _vertex_mean(records['v'].reshape(-1, 3).astype(np.float64))
+
+    # ASCII STL - scan the vertex lines with the compiled pattern so the
+    # hot loop stays in C instead of trimesh's Python parser
+    try:
+        with open(file_path, 'rb') as f:
+            return _ascii_stl_centroid(f.read())
+    except ValueError:
+        pass
+
+    # Malformed STL - fall back to trimesh's general loader
+    import trimesh
+    mesh = trimesh.load(file_path)
+    return np.asarray(mesh.centroid)
+
+
+# Matches the origin vector inside a wheel patch's rotatingWallVelocity
+# block in 0/U; compiled once so all four wheels update in a single pass
+WHEEL_ORIGIN_RE = re.compile(
+    rb'(\b(FL|FR|RL|RR)\b\s*\{[^{}]*?type\s+rotatingWallVelocity;\s*origin\s+)\([^)]+\)')
+
+DECOMPOSE_RE = re.compile(rb'numberOfSubdomains\s+\d+;')
+
+
+def _edit_file_bytes(path, edit):
+    """Apply a bytes-level edit to a file, in place via mmap when sizes match"""
+    with open(path, 'r+b') as f:
+        with mmap.mmap(f.fileno(), 0) as mm:
+            new_content = edit(mm[:])
+            if len(new_content) == len(mm):
+                # Same-size edits land straight in the page cache
+                mm[:] = new_content
+                return
+        f.seek(0)
+        f.write(new_content)
+        f.truncate()
+
+
+def _format_origin(centroid: np.ndarray) -> str:
+    """Format a centroid as an OpenFOAM origin vector in one formatting call"""
+    # tolist() unboxes all three numpy scalars at once and %-formatting
+    # renders them in a single C-level call
+    return "(%.8f %.6f %.6f)" % tuple(centroid.tolist())
+
+
+def _fast_copytree(src: Path, dst: Path):
+    """Copy a directory tree, using CoW reflinks where the filesystem supports them"""
+    try:
+        # cp --reflink=auto is a single process doing CoW clones on
+        # btrfs/XFS (near-instant) and sendfile copies elsewhere, which
+        # beats per-file Python overhead for baseCase's many small dicts
+        subprocess.run(['cp', '--reflink=auto', '-a', str(src), str(dst)],
+                       check=True, capture_output=True)
+        return
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    shutil.copytree(src, dst)
+
+
+def _fast_copy(src: str, dst: Path, hardlink: bool = False):
+    """Copy a single file, preferring a reflink (or hardlink) over moving data"""
+    try:
+        subprocess.run(['cp', '--reflink=always', str(src), str(dst)],
+                       check=True, capture_output=True)
+        return
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    if hardlink:
+        # Safe because OpenFOAM only reads the triSurface STLs
+        try:
+            if os.path.exists(dst):
+                os.remove(dst)
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
 class CaseSetup:
     """Handle OpenFOAM case setup and STL file copying"""
-    
-    def __init__(self, base_dir: str, case_dir: str, n_proc: int = 6):
+
+    # In-memory tarballs of base cases already copied this process, so a
+    # sweep walks each base tree once instead of once per candidate
+    _base_tar_cache: Dict[str, bytes] = {}
+
+    def __init__(self, base_dir: str, case_dir: str, n_proc: int = 6,
+                 hardlink_stls: bool = False):
         self.base_dir = Path(base_dir)
         self.case_dir = Path(case_dir)
         self.n_proc = n_proc
+        self.hardlink_stls = hardlink_stls
     
+    def _copy_base_case(self):
+        """Copy the base case, replaying a cached tarball on repeat setups"""
+        cache_key = str(self.base_dir.resolve())
+
+        tar_bytes = self._base_tar_cache.get(cache_key)
+        if tar_bytes is not None:
+            # One sequential extract - no per-file stat/open walk of the
+            # base tree
+            self.case_dir.mkdir(parents=True, exist_ok=True)
+            with tarfile.open(fileobj=io.BytesIO(tar_bytes)) as tar:
+                try:
+                    tar.extractall(self.case_dir, filter='tar')
+                except TypeError:  # Python < 3.12 has no extract filters
+                    tar.extractall(self.case_dir)
+            return
+
+        _fast_copytree(self.base_dir, self.case_dir)
+
+        # Snapshot the (static) base case while its pages are hot so
+        # later setups in this process skip the tree walk entirely
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode='w') as tar:
+            tar.add(self.base_dir, arcname='.')
+        self._base_tar_cache[cache_key] = buf.getvalue()
+
+    def _setup_digest(self, stl_files: Dict[str, str]) -> str:
+        """Hash base case metadata and STL contents to detect unchanged inputs"""
+        h = hashlib.blake2b()
+        for root, dirs, files in os.walk(self.base_dir):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                st = os.stat(path)
+                h.update(os.path.relpath(path, self.base_dir).encode())
+                h.update(struct.pack('<qq', st.st_size, st.st_mtime_ns))
+        for component in sorted(stl_files):
+            h.update(component.encode())
+            with open(stl_files[component], 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    h.update(mm)
+        return h.hexdigest()
+
     def setup_case(self, stl_files: Dict[str, str]) -> bool:
         """Set up the OpenFOAM case with selected STL files"""
         try:
-            # Remove existing case directory if it exists
+            digest = self._setup_digest(stl_files)
+            stamp_file = self.case_dir / ".setup_stamp"
+
+            # Skip the whole copy when the case was already set up from
+            # identical inputs - only the dict updates need to re-run
+            copy_needed = True
             if self.case_dir.exists():
-                print(f"Removing existing case directory: {self.case_dir}")
-                shutil.rmtree(self.case_dir)
-            
-            # Copy base case
-            print(f"Copying base case from {self.base_dir} to {self.case_dir}")
-            shutil.copytree(self.base_dir, self.case_dir)
-            
-            # Copy STL files to triSurface directory
+                if stamp_file.exists() and stamp_file.read_text() == digest:
+                    print(f"Case directory matches previous inputs, skipping copies")
+                    copy_needed = False
+                else:
+                    print(f"Removing existing case directory: {self.case_dir}")
+                    shutil.rmtree(self.case_dir)
+
             tri_surface_dir = self.case_dir / "constant" / "triSurface"
-            tri_surface_dir.mkdir(parents=True, exist_ok=True)
-            
-            wheel_centers = {}
-            
-            for component, file_path in stl_files.items():
-                dest_name = f"{component}.stl"
-                dest_path = tri_surface_dir / dest_name
-                
-                print(f"Copying {component}: {file_path} → {dest_path}")
-                shutil.copy2(file_path, dest_path)
-                
+
+            if copy_needed:
+                # Copy base case
+                print(f"Copying base case from {self.base_dir} to {self.case_dir}")
+                self._copy_base_case()
+
+                # Copy STL files to triSurface directory
+                tri_surface_dir.mkdir(parents=True, exist_ok=True)
+
+            def copy_and_measure(item):
+                """Copy one STL into the case and return its centroid (wheels only)"""
+                component, file_path = item
+                dest_path = tri_surface_dir / f"{component}.stl"
+
+                if copy_needed:
+                    print(f"Copying {component}: {file_path} → {dest_path}")
+                    _fast_copy(file_path, dest_path, hardlink=self.hardlink_stls)
+
                 # Calculate centroid for wheel components
                 if component in ["FL", "FR", "RL", "RR"]:
                     try:
-                        mesh = trimesh.load(file_path)
-                        centroid = mesh.centroid
-                        wheel_centers[component] = centroid
-                        print(f"  Calculated {component} center: ({centroid[0]:.8f} {centroid[1]:.6f} {centroid[2]:.6f})")
+                        return component, _stl_vertex_centroid(file_path)
                     except Exception as e:
                         print(f"  Warning: Could not calculate centroid for {component}: {e}")
+                return component, None
+
+            # The copies and centroid reads are independent and I/O-bound,
+            # so run all five components concurrently
+            wheel_centers = {}
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for component, centroid in executor.map(copy_and_measure, stl_files.items()):
+                    if centroid is not None:
+                        wheel_centers[component] = centroid
+                        print(f"  Calculated {component} center: {_format_origin(centroid)}")
             
             # Update wheel centers in U file
             if wheel_centers:
@@ -209,7 +402,10 @@ class CaseSetup:
             
             # Update decomposeParDict with processor count
             self._update_decompose_par_dict()
-            
+
+            # Stamp the case so identical re-runs can skip the copies
+            stamp_file.write_text(digest)
+
             print(f"✓ Case setup completed successfully!")
             return True
             
@@ -222,142 +418,154 @@ class CaseSetup:
         decompose_file = self.case_dir / "system" / "decomposeParDict"
         
         if decompose_file.exists():
-            # Read the file
-            with open(decompose_file, 'r') as f:
-                content = f.read()
-            
-            # Replace numberOfSubdomains
-            import re
-            content = re.sub(r'numberOfSubdomains\s+\d+;', f'numberOfSubdomains {self.n_proc};', content)
-            
-            # Write back
-            with open(decompose_file, 'w') as f:
-                f.write(content)
-            
+            # The dict is plain ASCII; edit it as bytes with the
+            # precompiled pattern to skip the decode/encode round-trip
+            replacement = b'numberOfSubdomains %d;' % self.n_proc
+            _edit_file_bytes(decompose_file,
+                             lambda content: DECOMPOSE_RE.sub(replacement, content))
+
             print(f"Updated decomposeParDict to use {self.n_proc} processors")
     
     def _update_wheel_centers(self, wheel_centers: Dict[str, np.ndarray]):
         """Update wheel center coordinates in the U file based on STL centroids"""
         u_file = self.case_dir / "0" / "U"
-        
+
         if not u_file.exists():
             print(f"Warning: U file not found at {u_file}")
             return
-        
-        # Read the U file
-        with open(u_file, 'r') as f:
-            content = f.read()
-        
+
         print("Updating wheel centers in U file...")
-        
-        # Update each wheel's origin
-        for component, centroid in wheel_centers.items():
-            # Format centroid coordinates with appropriate precision
-            origin_str = f"({centroid[0]:.8f} {centroid[1]:.6f} {centroid[2]:.6f})"
-            
-            # Create regex pattern to find and replace the origin line for this component
-            # Pattern matches: component name, then rotatingWallVelocity block, then origin line
-            pattern = rf'(\s+{component}\s*\{{\s*[\s\S]*?type\s+rotatingWallVelocity;\s*origin\s+)\([^)]+\)(;[\s\S]*?\}})'
-            
-            replacement = rf'\g<1>{origin_str}\g<2>'
-            
-            old_content = content
-            content = re.sub(pattern, replacement, content)
-            
-            if content != old_content:
+
+        # Format each wheel's origin once
+        origins = {component: _format_origin(centroid)
+                   for component, centroid in wheel_centers.items()}
+
+        # Prefer a structured edit through PyFoam's parser; the regex
+        # pass only remains for U files its parser cannot digest
+        try:
+            self._update_wheel_centers_parsed(u_file, origins)
+        except Exception as e:
+            print(f"  ParsedParameterFile update failed ({e}), using regex update")
+            self._update_wheel_centers_regex(u_file, origins)
+
+        print("✓ Wheel centers updated in U file")
+
+    def _update_wheel_centers_parsed(self, u_file: Path, origins: Dict[str, str]):
+        """Slot the new origins into the U file via PyFoam's dict parser"""
+        from PyFoam.RunDictionary.ParsedParameterFile import ParsedParameterFile
+
+        u_dict = ParsedParameterFile(str(u_file))
+        boundary_field = u_dict["boundaryField"]
+        for component, origin_str in origins.items():
+            boundary_field[component]["origin"] = origin_str
+        u_dict.writeFile()
+        for component, origin_str in origins.items():
+            print(f"  Updated {component} origin to: {origin_str}")
+
+    def _update_wheel_centers_regex(self, u_file: Path, origins: Dict[str, str]):
+        """Replace the origin vectors with a single compiled-regex pass"""
+        origin_bytes = {component.encode(): origin.encode()
+                        for component, origin in origins.items()}
+        updated = set()
+
+        def replace_origin(match):
+            component = match.group(2)
+            if component not in origin_bytes:
+                return match.group(0)
+            updated.add(component.decode())
+            return match.group(1) + origin_bytes[component]
+
+        _edit_file_bytes(u_file,
+                         lambda content: WHEEL_ORIGIN_RE.sub(replace_origin, content))
+
+        for component, origin_str in origins.items():
+            if component in updated:
                 print(f"  Updated {component} origin to: {origin_str}")
             else:
                 print(f"  Warning: Could not find/update {component} origin in U file")
-        
-        # Write back the updated content
-        with open(u_file, 'w') as f:
-            f.write(content)
-        
-        print("✓ Wheel centers updated in U file")
 
 
 class OpenFOAMRunner:
     """Handle OpenFOAM simulation execution using PyFoam"""
     
-    def __init__(self, case_dir: str, n_proc: int = 6):
+    def __init__(self, case_dir: str, n_proc: int = 6, serial_sfe: bool = False):
         self.case_dir = Path(case_dir)
         self.n_proc = n_proc
-        
-    def _run_with_log(self, argv, operation):
-        """Run OpenFOAM command with verbose terminal output"""
+        self.serial_sfe = serial_sfe
+
+    async def _run_with_log(self, argv, operation, logname=None):
+        """Run an OpenFOAM command, streaming its output to a case log file"""
         print(f"Running {operation}...")
-        runner = UtilityRunner(argv=argv, silent=False)
-        runner.quiet = False
-        runner.start()
-        runner.run.join()
-        success = runner.run.returncode == 0
+        log_path = self.case_dir / f"log.{logname or argv[0]}"
+        # An asyncio subprocess is enough when only the return code
+        # matters - no PyFoam thread or line parser needed, output goes
+        # straight to disk, and awaiting lets other steps overlap
+        with open(log_path, 'wb') as log:
+            proc = await asyncio.create_subprocess_exec(
+                *argv, stdout=log, stderr=subprocess.STDOUT)
+            returncode = await proc.wait()
+        success = returncode == 0
         if success:
             print(f"✓ {operation} completed successfully")
         else:
-            print(f"✗ {operation} failed with return code: {runner.run.returncode}")
+            print(f"✗ {operation} failed with return code: {returncode} (see {log_path})")
         return success
-        
-    def run_blockMesh(self):
+
+    async def run_blockMesh(self):
         """Generate background mesh"""
-        return self._run_with_log(["blockMesh", "-case", str(self.case_dir)], "blockMesh")
-    
-    def run_surfaceFeatureExtract(self, dictPath):
+        return await self._run_with_log(["blockMesh", "-case", str(self.case_dir)], "blockMesh")
+
+    async def run_surfaceFeatureExtract(self, dictPath):
         """Extract surface features for a specific dictionary"""
-        return self._run_with_log(
-            ["surfaceFeatureExtract", "-case", str(self.case_dir), "-dict", str(dictPath)], 
-            f"surfaceFeatureExtract ({dictPath})"
+        return await self._run_with_log(
+            ["surfaceFeatureExtract", "-case", str(self.case_dir), "-dict", str(dictPath)],
+            f"surfaceFeatureExtract ({dictPath})",
+            logname=f"surfaceFeatureExtract.{Path(dictPath).stem}"
         )
-    
-    def run_snappyHexMesh(self):
+
+    async def run_snappyHexMesh(self):
         """Generate mesh using snappyHexMesh"""
-        return self._run_with_log(
-            ["snappyHexMesh", "-overwrite", "-case", str(self.case_dir)], 
+        return await self._run_with_log(
+            ["snappyHexMesh", "-overwrite", "-case", str(self.case_dir)],
             "snappyHexMesh"
         )
 
-    def decompose_case(self):
+    async def decompose_case(self):
         """Decompose case for parallel processing"""
-        runner = UtilityRunner(argv=["decomposePar", "-force", "-case", str(self.case_dir)], silent=False)
-        runner.quiet = False
-        runner.start()
-        runner.run.join()
-        success = runner.run.returncode == 0
-        if success:
-            print("✓ Case decomposition completed")
-        else:
-            print("✗ Case decomposition failed")
-        return success
+        return await self._run_with_log(
+            ["decomposePar", "-force", "-case", str(self.case_dir)],
+            "decomposePar"
+        )
 
-    def run_parallel_simpleFoam(self):
+    async def run_parallel_simpleFoam(self):
         """Run simpleFoam solver in parallel"""
-        print(f"Running simpleFoam with {self.n_proc} processors...")
-        mpirun_cmd = ["mpirun", "--allow-run-as-root", "-np", str(self.n_proc), 
+        # Pin each rank to a core and keep intra-node messages on the
+        # shared-memory BTL - the pressure solve is memory-bandwidth
+        # bound and benefits from stable cache locality
+        mpirun_cmd = ["mpirun", "--allow-run-as-root",
+                     "--bind-to", "core", "--map-by", "core",
+                     "--mca", "btl", "vader,self", "--mca", "pml", "ob1",
+                     "-np", str(self.n_proc),
                      "simpleFoam", "-case", str(self.case_dir), "-parallel"]
-        runner = BasicRunner(argv=mpirun_cmd, silent=False)
-        runner.start()
-        runner.run.join()
-        success = runner.run.returncode == 0
-        if success:
-            print("✓ Parallel simpleFoam completed")
-        else:
-            print("✗ Parallel simpleFoam failed")
-        return success
+        return await self._run_with_log(
+            mpirun_cmd, f"simpleFoam ({self.n_proc} processors)", logname="simpleFoam")
 
-    def reconstruct_case(self):
+    async def reconstruct_case(self):
         """Reconstruct parallel case results"""
-        runner = UtilityRunner(argv=["reconstructPar", "-case", str(self.case_dir)], silent=False)
-        runner.quiet = False
-        runner.start()
-        runner.run.join()
-        success = runner.run.returncode == 0
-        if success:
-            print("✓ Case reconstruction completed")
-        else:
-            print("✗ Case reconstruction failed")
-        return success
-    
-    def run_all_surfaceFeatureExtract(self):
+        return await self._run_with_log(
+            ["reconstructPar", "-case", str(self.case_dir)],
+            "reconstructPar"
+        )
+
+    async def run_all_surfaceFeatureExtract(self):
         """Run surface feature extraction for all components"""
+        # A combined dict with one sub-dict per STL amortises a single
+        # process fork and OpenFOAM init across all five surfaces; use it
+        # whenever the base case ships one
+        combined_dict = self.case_dir / "system" / "surfaceFeatureExtractDict"
+        if combined_dict.exists():
+            return await self.run_surfaceFeatureExtract("system/surfaceFeatureExtractDict")
+
         dicts = [
             "system/surfaceFeatureExtract_mainBodyDict",
             "system/surfaceFeatureExtract_FLDict",
@@ -365,31 +573,47 @@ class OpenFOAMRunner:
             "system/surfaceFeatureExtract_RLDict",
             "system/surfaceFeatureExtract_RRDict",
         ]
-        for dict_path in dicts:
-            if not self.run_surfaceFeatureExtract(dict_path):
-                return False
-        return True
-    
-    def run_full_simulation(self):
+        if self.serial_sfe:
+            for dict_path in dicts:
+                if not await self.run_surfaceFeatureExtract(dict_path):
+                    return False
+            return True
+
+        # The five extractions read different STLs and write different
+        # eMesh files, so run them concurrently; per-dict log files keep
+        # each invocation's output separate
+        results = await asyncio.gather(
+            *(self.run_surfaceFeatureExtract(dict_path) for dict_path in dicts))
+        return all(results)
+
+    async def run_mesh_prerequisites(self):
+        """Run blockMesh and surface feature extraction concurrently"""
+        # blockMesh reads system/blockMeshDict and writes constant/polyMesh;
+        # surfaceFeatureExtract reads the STLs and writes feature edge
+        # meshes - no shared data, so they can overlap
+        results = await asyncio.gather(
+            self.run_blockMesh(), self.run_all_surfaceFeatureExtract())
+        return all(results)
+
+    async def run_full_simulation(self):
         """Run the complete OpenFOAM simulation pipeline"""
         print("Starting full OpenFOAM simulation pipeline...")
         start_time = time.time()
-        
+
         steps = [
-            ("Background mesh generation", self.run_blockMesh),
-            ("Surface feature extraction", self.run_all_surfaceFeatureExtract),
+            ("Background mesh + surface feature extraction", self.run_mesh_prerequisites),
             ("Mesh generation", self.run_snappyHexMesh),
             ("Case decomposition", self.decompose_case),
             ("Parallel solver", self.run_parallel_simpleFoam),
             ("Case reconstruction", self.reconstruct_case),
         ]
-        
+
         for step_name, step_func in steps:
             print(f"\n{'='*60}")
             print(f"Step: {step_name}")
             print(f"{'='*60}")
-            
-            if not step_func():
+
+            if not await step_func():
                 print(f"✗ Simulation failed at step: {step_name}")
                 return False
         
@@ -408,28 +632,55 @@ class ResultsExtractor:
     
     def __init__(self, case_dir: str):
         self.case_dir = Path(case_dir)
-    
+
+    @staticmethod
+    def _read_last_data_row(filepath: Path) -> Optional[np.ndarray]:
+        """Read the last non-comment row of a dat file without parsing the history"""
+        with open(filepath, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - 4096))
+            tail = f.read()
+
+        if size > 4096:
+            # Drop the (possibly partial) first line of the tail window
+            _, _, tail = tail.partition(b'\n')
+
+        for line in reversed(tail.splitlines()):
+            line = line.strip()
+            if line and not line.startswith(b'#'):
+                try:
+                    return np.array(line.split(), dtype=np.float64)
+                except ValueError:
+                    return None
+        return None
+
     def extract_latest_cd(self) -> Optional[Dict]:
         """Extract the latest drag coefficient from simulation results"""
         post_dir = self.case_dir / "postProcessing" / "forceCoeffs1" / "0"
         filepath = post_dir / "coefficient.dat"
-        
+
         if not filepath.exists():
             print(f"Warning: coefficient.dat not found at: {filepath}")
             return None
-        
+
         try:
-            data = np.loadtxt(filepath, comments="#")
-            if len(data) == 0:
-                print("Warning: No data found in coefficient.dat")
-                return None
-            
-            # Handle both 1D and 2D arrays
-            if data.ndim == 1:
-                latest_row = data
-            else:
-                latest_row = data[-1]
-            
+            # A converged run's history can be thousands of rows; only the
+            # last one matters, so read it from the file tail
+            latest_row = self._read_last_data_row(filepath)
+
+            if latest_row is None:
+                data = np.loadtxt(filepath, comments="#")
+                if len(data) == 0:
+                    print("Warning: No data found in coefficient.dat")
+                    return None
+
+                # Handle both 1D and 2D arrays
+                if data.ndim == 1:
+                    latest_row = data
+                else:
+                    latest_row = data[-1]
+
             time, Cd, Cl, Cm = latest_row[0], latest_row[1], latest_row[4], latest_row[6]
             
             result = {
@@ -472,6 +723,10 @@ def main():
                        help='Directory containing STL files (FL.stl, FR.stl, etc.). If not provided, will prompt for selection.')
     parser.add_argument('--n-proc', type=int, default=6,
                        help='Number of processors for parallel run (default: 6)')
+    parser.add_argument('--hardlink-stls', action='store_true',
+                       help='Hardlink STL files into the case instead of copying (same filesystem only)')
+    parser.add_argument('--serial-sfe', action='store_true',
+                       help='Run surfaceFeatureExtract invocations one at a time (for debugging)')
     parser.add_argument('--auto-run', action='store_true',
                        help='Skip confirmations and run automatically')
     parser.add_argument('--cli-mode', action='store_true',
@@ -540,7 +795,8 @@ def main():
     print("\n2. Case Setup")
     print("-" * 30)
     
-    case_setup = CaseSetup(args.base_dir, args.case_dir, args.n_proc)
+    case_setup = CaseSetup(args.base_dir, args.case_dir, args.n_proc,
+                           hardlink_stls=args.hardlink_stls)
     if not case_setup.setup_case(stl_files):
         print("Case setup failed. Exiting...")
         sys.exit(1)
@@ -549,8 +805,8 @@ def main():
     print("\n3. Running Simulation")
     print("-" * 30)
     
-    runner = OpenFOAMRunner(args.case_dir, args.n_proc)
-    if not runner.run_full_simulation():
+    runner = OpenFOAMRunner(args.case_dir, args.n_proc, serial_sfe=args.serial_sfe)
+    if not asyncio.run(runner.run_full_simulation()):
         print("Simulation failed. Exiting...")
         sys.exit(1)
     